@@ -0,0 +1,268 @@
+"""
+Model Training Pipeline
+Parallel, out-of-core training of the disaster models with versioned, atomically published artifacts
+
+Layout of models_dir:
+    models/<name>/<version>/model.pkl, scaler.pkl   immutable, one directory per trained version
+    models/<name>/CURRENT                           name of the live version (swapped with os.replace)
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import joblib
+from joblib import Parallel, delayed
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+MODELS_DIR = "models"
+CHUNK_SIZE = 100_000
+KEEP_VERSIONS = 3
+SCRATCH_DIR = ".scratch"  # under models_dir; the default temp dir is often tmpfs, i.e. RAM
+
+MODEL_SPECS = {
+    'flood': {
+        'features': ['rainfall', 'river_level', 'soil_moisture', 'temperature', 'humidity'],
+        'target': 'flood_occurred',
+        'params': {'n_estimators': 100, 'max_depth': 10, 'random_state': 42},
+    },
+    'earthquake': {
+        'features': ['magnitude', 'depth', 'distance_from_fault', 'peak_ground_accel'],
+        'target': 'quake_occurred',
+        'params': {'n_estimators': 100, 'random_state': 42},
+    },
+    'cloudburst': {
+        'features': ['rainfall_rate', 'duration', 'cloud_water_content', 'temp_diff'],
+        'target': 'cloudburst_occurred',
+        'params': {'n_estimators': 100, 'random_state': 42},
+    },
+    'avalanche': {
+        'features': ['snow_depth', 'slope_angle', 'temperature', 'wind_speed'],
+        'target': 'avalanche_occurred',
+        'params': {'n_estimators': 100, 'random_state': 42},
+    },
+}
+
+### DATA SOURCES
+def iter_chunks(name, source, chunk_size=CHUNK_SIZE):
+    """
+    Yields (X, y) numpy chunks for a model from any supported source:
+    - pandas DataFrame (in memory)
+    - path to a .csv file (read chunk_size rows at a time)
+    - path to a .npy file, or a numpy array / np.memmap, with the feature
+      columns in MODEL_SPECS order followed by the target column (memory-mapped)
+    - callable returning a fresh iterable of DataFrame chunks (called once per pass)
+    """
+    spec = MODEL_SPECS[name]
+    columns = spec['features'] + [spec['target']]
+
+    if isinstance(source, str) and source.endswith('.npy'):
+        source = np.load(source, mmap_mode='r')
+
+    if isinstance(source, pd.DataFrame):
+        frames = (source.iloc[i:i + chunk_size] for i in range(0, len(source), chunk_size))
+    elif isinstance(source, str):
+        frames = pd.read_csv(source, usecols=columns, chunksize=chunk_size)
+    elif isinstance(source, np.ndarray):
+        for i in range(0, len(source), chunk_size):
+            block = np.asarray(source[i:i + chunk_size])
+            yield block[:, :-1], block[:, -1]
+        return
+    elif callable(source):
+        frames = source()
+    else:
+        raise TypeError(f"Unsupported training data source for {name}: {type(source).__name__}")
+
+    for frame in frames:
+        yield frame[spec['features']].to_numpy(), frame[spec['target']].to_numpy()
+
+### TRAINING
+def fit_model(name, source, chunk_size=CHUNK_SIZE, n_jobs=-1, tmp_dir=None):
+    """
+    Fits the scaler and Random Forest for one disaster type without holding the
+    raw dataset in memory: pass 1 streams chunks into StandardScaler.partial_fit,
+    pass 2 writes the scaled rows into a temporary memory-mapped file that the
+    forest is fitted on (trees are built in parallel with n_jobs). The memmap lives
+    in tmp_dir, which defaults to models/.scratch so it is backed by disk.
+    Returns (model, scaler, training accuracy).
+    """
+    spec = MODEL_SPECS[name]
+    scaler = StandardScaler()
+    n_rows, y_dtype = 0, None
+    for X, y in iter_chunks(name, source, chunk_size):
+        if len(X) == 0:
+            continue
+        scaler.partial_fit(X)
+        n_rows += len(X)
+        y_dtype = np.result_type(y_dtype, y.dtype) if y_dtype is not None else y.dtype
+    if n_rows == 0:
+        raise ValueError(f"No training data for {name} model")
+
+    tmp_dir = tmp_dir or os.path.join(MODELS_DIR, SCRATCH_DIR)
+    os.makedirs(tmp_dir, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix=f"{name}-train-", dir=tmp_dir) as tmp:
+        X_path, y_path = os.path.join(tmp, "X.npy"), os.path.join(tmp, "y.npy")
+        X_mm = np.lib.format.open_memmap(X_path, mode='w+', dtype=np.float32, shape=(n_rows, len(spec['features'])))
+        y_mm = np.lib.format.open_memmap(y_path, mode='w+', dtype=y_dtype, shape=(n_rows,))
+        offset = 0
+        for X, y in iter_chunks(name, source, chunk_size):
+            if len(X) == 0:
+                continue
+            if offset + len(X) > n_rows:
+                raise ValueError(f"Training data for {name} model changed between passes (more than {n_rows} rows)")
+            X_mm[offset:offset + len(X)] = scaler.transform(X)
+            y_mm[offset:offset + len(X)] = y
+            offset += len(X)
+        if offset != n_rows:
+            raise ValueError(f"Training data for {name} model changed between passes ({offset} of {n_rows} rows)")
+        X_mm.flush()
+        y_mm.flush()
+        del X_mm, y_mm
+
+        X_scaled = np.load(X_path, mmap_mode='r')
+        y = np.load(y_path, mmap_mode='r')
+        model = RandomForestClassifier(n_jobs=n_jobs, **spec['params'])
+        model.fit(X_scaled, y)
+        correct = sum(
+            int((model.predict(X_scaled[i:i + chunk_size]) == y[i:i + chunk_size]).sum())
+            for i in range(0, n_rows, chunk_size)
+        )
+        del X_scaled, y
+    return model, scaler, correct / n_rows
+
+### VERSIONED ARTIFACTS
+def _umask():
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+def _fsync(path):
+    """fsyncs a file or directory (directories make renames/new entries durable)"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _write_atomic(path, text):
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates 0600; give CURRENT the normal umask-derived mode so other users can read it
+        os.chmod(tmp_path, 0o666 & ~_umask())
+        os.replace(tmp_path, path)
+        _fsync(os.path.dirname(path))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+def publish_model(name, model, scaler, models_dir=MODELS_DIR, keep=KEEP_VERSIONS):
+    """
+    Writes a new immutable version directory for the model and then atomically
+    points CURRENT at it, so readers only ever see a complete model/scaler pair.
+    The pickles and directory entries are fsynced before CURRENT is flipped, so
+    after a crash CURRENT never points at a partially written version.
+    Returns the new version string.
+    """
+    model_dir = os.path.join(models_dir, name)
+    os.makedirs(model_dir, exist_ok=True)
+    version = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+    staging = tempfile.mkdtemp(prefix=f".{version}-", dir=model_dir)
+    try:
+        for filename, obj in (("model.pkl", model), ("scaler.pkl", scaler)):
+            joblib.dump(obj, os.path.join(staging, filename))
+            _fsync(os.path.join(staging, filename))
+        # mkdtemp creates 0700; readers may run as a different user than the trainer
+        os.chmod(staging, 0o777 & ~_umask())
+        _fsync(staging)
+        os.rename(staging, os.path.join(model_dir, version))
+        _fsync(model_dir)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    _write_atomic(os.path.join(model_dir, "CURRENT"), version)
+    prune_versions(name, models_dir, keep)
+    return version
+
+def list_versions(name, models_dir=MODELS_DIR):
+    model_dir = os.path.join(models_dir, name)
+    if not os.path.isdir(model_dir):
+        return []
+    return sorted(
+        entry for entry in os.listdir(model_dir)
+        if not entry.startswith('.') and os.path.isdir(os.path.join(model_dir, entry))
+    )
+
+def prune_versions(name, models_dir=MODELS_DIR, keep=KEEP_VERSIONS):
+    """Deletes all but the newest `keep` versions, never touching the live one"""
+    live = current_version(name, models_dir)
+    for version in list_versions(name, models_dir)[:-keep]:
+        if version != live:
+            shutil.rmtree(os.path.join(models_dir, name, version), ignore_errors=True)
+
+def current_version(name, models_dir=MODELS_DIR):
+    try:
+        with open(os.path.join(models_dir, name, "CURRENT")) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+def load_model(name, models_dir=MODELS_DIR, version=None):
+    """
+    Loads (version, model, scaler) for the given or live version. Falls back to the
+    flat models/<name>_model.pkl files from before versioning as version "legacy".
+    """
+    version = version or current_version(name, models_dir)
+    if version is None:
+        model = joblib.load(os.path.join(models_dir, f"{name}_model.pkl"))
+        scaler = joblib.load(os.path.join(models_dir, f"{name}_scaler.pkl"))
+        return "legacy", model, scaler
+    version_dir = os.path.join(models_dir, name, version)
+    model = joblib.load(os.path.join(version_dir, "model.pkl"))
+    scaler = joblib.load(os.path.join(version_dir, "scaler.pkl"))
+    return version, model, scaler
+
+### PIPELINE
+def train_model(name, source, chunk_size=CHUNK_SIZE, n_jobs=-1, models_dir=MODELS_DIR, tmp_dir=None):
+    """Fits and publishes one model; returns (version, training accuracy)"""
+    tmp_dir = tmp_dir or os.path.join(models_dir, SCRATCH_DIR)
+    model, scaler, score = fit_model(name, source, chunk_size=chunk_size, n_jobs=n_jobs, tmp_dir=tmp_dir)
+    version = publish_model(name, model, scaler, models_dir=models_dir)
+    print(f"✅ Published {name} model {version} (accuracy {score:.3f})")
+    return version, score
+
+def train_all(sources, chunk_size=CHUNK_SIZE, n_jobs=-1, models_dir=MODELS_DIR, tmp_dir=None):
+    """
+    Trains several models concurrently, one worker process per model, splitting the
+    available cores between them for tree building.
+    sources: {name: source} (see iter_chunks). Returns {name: (version, accuracy)}.
+    """
+    n_cpus = joblib.cpu_count() if n_jobs is None or n_jobs < 0 else n_jobs
+    outer = max(1, min(len(sources), n_cpus))
+    inner = max(1, n_cpus // outer)
+    results = Parallel(n_jobs=outer)(
+        delayed(train_model)(name, source, chunk_size=chunk_size, n_jobs=inner, models_dir=models_dir, tmp_dir=tmp_dir)
+        for name, source in sources.items()
+    )
+    return dict(zip(sources, results))
+
+if __name__ == "__main__":
+    # Usage: python -m ai_engine.model_training [name=path.csv|path.npy ...]
+    # Without arguments, all four models are trained on the built-in sample data.
+    if len(sys.argv) > 1:
+        sources = dict(arg.split('=', 1) for arg in sys.argv[1:])
+    else:
+        if not __package__:
+            sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        from ai_engine.sample_data import SAMPLE_DATA
+        sources = {name: SAMPLE_DATA[name]() for name in MODEL_SPECS}
+    for name, (version, score) in train_all(sources).items():
+        print(f"{name}: {version} accuracy={score:.3f}")
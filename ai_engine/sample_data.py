@@ -0,0 +1,55 @@
+"""
+Sample Training Data
+Synthetic datasets for the disaster models (used for demos and when no real data is available)
+"""
+
+import numpy as np
+import pandas as pd
+
+def generate_sample_flood_data():
+    np.random.seed(42)
+    return pd.DataFrame({
+        'rainfall': np.random.uniform(0, 300, 1000),
+        'river_level': np.random.uniform(0, 20, 1000),
+        'soil_moisture': np.random.uniform(10, 100, 1000),
+        'temperature': np.random.uniform(15, 40, 1000),
+        'humidity': np.random.uniform(40, 100, 1000),
+        'flood_occurred': np.random.randint(0, 2, 1000)
+    })
+
+def generate_sample_earthquake_data():
+    np.random.seed(42)
+    return pd.DataFrame({
+        'magnitude': np.random.uniform(3, 9, 1000),
+        'depth': np.random.uniform(1, 70, 1000),
+        'distance_from_fault': np.random.uniform(0, 100, 1000),
+        'peak_ground_accel': np.random.uniform(0.01, 1.0, 1000),
+        'quake_occurred': np.random.randint(0, 2, 1000)
+    })
+
+def generate_sample_cloudburst_data():
+    np.random.seed(42)
+    return pd.DataFrame({
+        'rainfall_rate': np.random.uniform(50, 200, 1000), # mm/hr
+        'duration': np.random.uniform(10, 60, 1000),       # minutes
+        'cloud_water_content': np.random.uniform(10, 50, 1000), # g/m3
+        'temp_diff': np.random.uniform(2, 15, 1000),       # deg C
+        'cloudburst_occurred': np.random.randint(0, 2, 1000)
+    })
+
+def generate_sample_avalanche_data():
+    np.random.seed(42)
+    return pd.DataFrame({
+        'snow_depth': np.random.uniform(50, 300, 1000),    # cm
+        'slope_angle': np.random.uniform(25, 50, 1000),    # degrees
+        'temperature': np.random.uniform(-15, 5, 1000),    # degC
+        'wind_speed': np.random.uniform(0, 30, 1000),      # m/s
+        'avalanche_occurred': np.random.randint(0, 2, 1000)
+    })
+
+SAMPLE_DATA = {
+    'flood': generate_sample_flood_data,
+    'earthquake': generate_sample_earthquake_data,
+    'cloudburst': generate_sample_cloudburst_data,
+    'avalanche': generate_sample_avalanche_data,
+}
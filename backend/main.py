@@ -27,6 +27,7 @@ SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-this")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+MODEL_RELOAD_SECONDS = int(os.getenv("MODEL_RELOAD_SECONDS", "60"))
 
 # Initialize FastAPI
 app = FastAPI(
@@ -252,6 +253,15 @@ async def predict_disaster(disaster_type: str, payload: dict = Body(...)):
         raise HTTPException(status_code=400, detail="Unknown disaster type")
     return result
 
+@app.get("/models")
+async def get_model_versions():
+    return predictor.versions
+
+@app.post("/models/reload")
+async def reload_models(current_user: str = Depends(get_current_user)):
+    swapped = await asyncio.to_thread(predictor.reload_models)
+    return {"reloaded": swapped, "versions": predictor.versions}
+
 @app.post("/optimize/resources")
 async def optimize_resources(payload: dict = Body(...)):
     resource_coords = np.array(payload["resource_coords"])
@@ -296,6 +306,18 @@ async def run_fetch_flood_periodically():
             await asyncio.sleep(1800)
     asyncio.create_task(fetch_loop())
 
+@app.on_event("startup")
+async def watch_model_versions():
+    async def reload_loop():
+        while True:
+            await asyncio.sleep(MODEL_RELOAD_SECONDS)
+            try:
+                # Load off the event loop; predictions keep serving the old version until the swap
+                await asyncio.to_thread(predictor.reload_models)
+            except Exception as e:
+                print("model reload error:", e)
+    asyncio.create_task(reload_loop())
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,55 @@
+import pytest
+
+from ai_engine import disaster_prediction, model_training as mt
+from ai_engine.disaster_prediction import DisasterPredictor
+from ai_engine.sample_data import generate_sample_flood_data
+
+
+@pytest.fixture(scope="module")
+def flood_fit(tmp_path_factory):
+    data = generate_sample_flood_data().iloc[:200]
+    model, scaler, _ = mt.fit_model('flood', data, n_jobs=1, tmp_dir=str(tmp_path_factory.mktemp("scratch")))
+    return model, scaler
+
+
+def test_reload_models_swaps_only_changed_versions(flood_fit, tmp_path):
+    models_dir = str(tmp_path)
+    first = mt.publish_model('flood', *flood_fit, models_dir=models_dir)
+    predictor = DisasterPredictor(models_dir=models_dir)
+    assert predictor.versions == {'flood': first}
+    assert predictor.reload_models() == []
+
+    second = mt.publish_model('flood', *flood_fit, models_dir=models_dir)
+    assert predictor.reload_models() == ['flood']
+    assert predictor.versions == {'flood': second}
+    assert predictor.reload_models() == []
+    assert predictor.predict_flood_risk(120, 12, 80, 28, 90)['disaster_type'] == 'flood'
+
+
+def test_reload_models_keeps_old_bundle_when_new_version_fails(flood_fit, tmp_path):
+    models_dir = str(tmp_path)
+    version = mt.publish_model('flood', *flood_fit, models_dir=models_dir)
+    predictor = DisasterPredictor(models_dir=models_dir)
+    before = predictor.predict_flood_risk(120, 12, 80, 28, 90)
+
+    # CURRENT points at a version whose pickles are missing
+    mt._write_atomic(str(tmp_path / 'flood' / 'CURRENT'), "20990101T000000000000")
+    assert predictor.reload_models() == []
+    assert predictor.versions == {'flood': version}
+    assert predictor.predict_flood_risk(120, 12, 80, 28, 90) == before
+
+
+def test_reload_models_continues_after_unreadable_current(flood_fit, tmp_path, monkeypatch):
+    models_dir = str(tmp_path)
+    predictor = DisasterPredictor(models_dir=models_dir)
+    for name in ('flood', 'avalanche'):
+        mt.publish_model(name, *flood_fit, models_dir=models_dir)
+
+    def current_version(name, models_dir):
+        if name == 'flood':
+            raise PermissionError("CURRENT is not readable")
+        return mt.current_version(name, models_dir)
+
+    monkeypatch.setattr(disaster_prediction, 'current_version', current_version)
+    assert predictor.reload_models() == ['avalanche']
+    assert 'flood' not in predictor.versions
@@ -0,0 +1,120 @@
+import os
+import numpy as np
+import pandas as pd
+import joblib
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+from ai_engine import model_training as mt
+from ai_engine.sample_data import generate_sample_flood_data
+
+SPEC = mt.MODEL_SPECS['flood']
+
+
+@pytest.fixture(scope="module")
+def flood_data():
+    return generate_sample_flood_data()
+
+
+@pytest.fixture(scope="module")
+def baseline(flood_data):
+    # Same steps as the original in-memory train_flood_model
+    X = flood_data[SPEC['features']].to_numpy()
+    scaler = StandardScaler().fit(X)
+    model = RandomForestClassifier(**SPEC['params']).fit(scaler.transform(X), flood_data[SPEC['target']])
+    return model, scaler
+
+
+def _source(kind, data, tmp_path):
+    if kind == "dataframe":
+        return data
+    if kind == "csv":
+        path = str(tmp_path / "flood.csv")
+        data.to_csv(path, index=False)
+        return path
+    path = str(tmp_path / "flood.npy")
+    np.save(path, data[SPEC['features'] + [SPEC['target']]].to_numpy())
+    return path
+
+
+@pytest.mark.parametrize("kind", ["dataframe", "csv", "npy"])
+def test_fit_model_matches_in_memory_baseline(kind, flood_data, baseline, tmp_path):
+    base_model, base_scaler = baseline
+    source = _source(kind, flood_data, tmp_path)
+    model, scaler, score = mt.fit_model('flood', source, chunk_size=300, n_jobs=1, tmp_dir=str(tmp_path))
+
+    X = flood_data[SPEC['features']].to_numpy()
+    y = flood_data[SPEC['target']].to_numpy()
+    np.testing.assert_allclose(scaler.mean_, base_scaler.mean_)
+    np.testing.assert_allclose(scaler.scale_, base_scaler.scale_)
+    np.testing.assert_allclose(
+        model.predict_proba(scaler.transform(X)), base_model.predict_proba(base_scaler.transform(X))
+    )
+    assert score == pytest.approx(base_model.score(base_scaler.transform(X), y))
+
+
+def test_fit_model_skips_empty_chunks(flood_data, tmp_path):
+    def chunks():
+        yield flood_data.iloc[:0]
+        yield flood_data.iloc[:500]
+        yield flood_data.iloc[500:]
+
+    _, _, score = mt.fit_model('flood', chunks, n_jobs=1, tmp_dir=str(tmp_path))
+    assert 0 <= score <= 1
+
+
+def test_fit_model_rejects_source_that_shrinks_between_passes(flood_data, tmp_path):
+    passes = []
+
+    def chunks():
+        passes.append(1)
+        return [flood_data if len(passes) == 1 else flood_data.iloc[:500]]
+
+    with pytest.raises(ValueError, match="changed between passes"):
+        mt.fit_model('flood', chunks, n_jobs=1, tmp_dir=str(tmp_path))
+
+
+def test_fit_model_removes_scratch_files(flood_data, tmp_path):
+    mt.fit_model('flood', flood_data, n_jobs=1, tmp_dir=str(tmp_path))
+    assert os.listdir(tmp_path) == []
+
+
+def test_publish_model_is_readable_by_other_users(tmp_path):
+    old_umask = os.umask(0o022)
+    try:
+        version = mt.publish_model('flood', {'model': 1}, {'scaler': 1}, models_dir=str(tmp_path))
+    finally:
+        os.umask(old_umask)
+    model_dir = tmp_path / 'flood'
+    assert (model_dir / version).stat().st_mode & 0o777 == 0o755
+    assert (model_dir / version / 'model.pkl').stat().st_mode & 0o777 == 0o644
+    assert (model_dir / 'CURRENT').stat().st_mode & 0o777 == 0o644
+    assert not [entry for entry in os.listdir(model_dir) if entry.startswith('.')]
+
+
+def test_publish_and_prune_keep_live_and_newest_versions(tmp_path):
+    models_dir = str(tmp_path)
+    versions = [mt.publish_model('flood', {'n': i}, {'n': i}, models_dir=models_dir, keep=2) for i in range(4)]
+    assert mt.current_version('flood', models_dir) == versions[-1]
+    assert mt.list_versions('flood', models_dir) == versions[-2:]
+    assert mt.load_model('flood', models_dir) == (versions[-1], {'n': 3}, {'n': 3})
+
+    # Roll back to an older version: pruning must never delete the live one
+    mt._write_atomic(os.path.join(models_dir, 'flood', 'CURRENT'), versions[-2])
+    mt.prune_versions('flood', models_dir, keep=1)
+    assert mt.list_versions('flood', models_dir) == versions[-2:]
+    assert mt.load_model('flood', models_dir) == (versions[-2], {'n': 2}, {'n': 2})
+
+def test_load_model_falls_back_to_legacy_pickles(tmp_path):
+    joblib.dump({'legacy': 'model'}, tmp_path / 'flood_model.pkl')
+    joblib.dump({'legacy': 'scaler'}, tmp_path / 'flood_scaler.pkl')
+    assert mt.load_model('flood', str(tmp_path)) == ('legacy', {'legacy': 'model'}, {'legacy': 'scaler'})
+
+    version = mt.publish_model('flood', {'new': 'model'}, {'new': 'scaler'}, models_dir=str(tmp_path))
+    assert mt.load_model('flood', str(tmp_path)) == (version, {'new': 'model'}, {'new': 'scaler'})
+
+
+def test_load_model_without_any_artifacts_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        mt.load_model('flood', str(tmp_path))